@@ -131,7 +131,7 @@ setup(
         'docutils',
         'jsonschema',
         'mimeparse',
-        'PyYaml',
+        'PyYaml>=5.4,<6',  # 5.4: Linux/macOS wheels bundle libyaml; 6: config_loader 1.0.0 calls yaml.load() without Loader
         'PyJWT==1.7.1',
         'psycopg2-binary',
         'SQLAlchemy==1.1',
@@ -116,6 +116,10 @@ async def _enforce_all_of(request: web.Request,
 
 
 def authorize(p_method=None):
+    # The swagger specification uses lower case method names. Normalize a
+    # fixed ``p_method`` once here, instead of on every request:
+    p_method = p_method.lower() if p_method is not None else None
+
     def decorator(f: T.Callable):
         @functools.wraps(f)
         async def wrapper(self: View, *args, **kwargs):
@@ -128,14 +132,14 @@ def authorize(p_method=None):
             assert path is not None
             assert path.startswith(base_path)
             path = path[len(base_path):]
-            method = p_method or self.request.method
-            if method.lower() not in paths[path]:
+            method = p_method or self.request.method.lower()
+            if method not in paths[path]:
                 raise web.HTTPMethodNotAllowed(
-                    method, list([
+                    method.upper(), list([
                         method.upper() for method in paths[path].keys()
                     ])
                 )
-            method_info = paths[path][method.lower()]
+            method_info = paths[path][method]
             if 'security' in method_info:
                 await enforce_one_of(self.request, method_info['security'])
             return await f(self, *args, **kwargs)
@@ -16,25 +16,26 @@ class Root(view.OAuth2View):
         return 'Authorization Administration API'
 
     async def _links(self):
+        embed = self.embed
         accounts = _accounts.Accounts(
             self.request,
             {},
-            embed=self.embed.get('accounts')
+            embed=embed.get('accounts')
         )
         datasets = _scopes.Datasets(
             self.request,
             {},
-            embed=self.embed.get('datasets')
+            embed=embed.get('datasets')
         )
         profiles = _profiles.Profiles(
             self.request,
             {},
-            embed=self.embed.get('profiles')
+            embed=embed.get('profiles')
         )
         roles = _roles.Roles(
             self.request,
             {},
-            embed=self.embed.get('roles')
+            embed=embed.get('roles')
         )
         return {
             'accounts': accounts,
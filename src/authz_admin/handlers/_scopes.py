@@ -18,25 +18,30 @@ class Datasets(view.OAuth2View):
         return 'Datasets'
 
     async def _links(self):
+        embed = self.embed.get('item')
         items = [
             Dataset(
                 self.request,
                 {'dataset': name},
-                self.embed.get('item')
+                embed,
+                dataset=dataset
             )
-            for name in self.request.app['config']['authz_admin']['datasets']
+            for name, dataset
+            in self.request.app['config']['authz_admin']['datasets'].items()
         ]
         return {'item': items}
 
 
 class Dataset(view.OAuth2View):
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, dataset=None, **kwargs):
         super().__init__(*args, **kwargs)
-        datasets = self.request.app['config']['authz_admin']['datasets']
-        if self['dataset'] not in datasets:
-            raise web.HTTPNotFound()
-        self._dataset = datasets[self['dataset']]
+        if dataset is None:
+            datasets = self.request.app['config']['authz_admin']['datasets']
+            if self['dataset'] not in datasets:
+                raise web.HTTPNotFound()
+            dataset = datasets[self['dataset']]
+        self._dataset = dataset
 
     @property
     def link_title(self):
@@ -46,14 +51,17 @@ class Dataset(view.OAuth2View):
         return self.request.app['etag']
 
     async def _links(self):
+        embed = self.embed.get('item')
         result = {
             'item': [
                 Scope(
                     self.request,
                     {'dataset': self['dataset'], 'scope': name},
-                    self.embed.get('item')
+                    embed,
+                    dataset=self._dataset,
+                    scope=scope
                 )
-                for name in self._dataset['scopes']
+                for name, scope in self._dataset['scopes'].items()
             ]
         }
         if 'described_by' in self._dataset:
@@ -63,16 +71,20 @@ class Dataset(view.OAuth2View):
 
 class Scope(view.OAuth2View):
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, dataset=None, scope=None, **kwargs):
         super().__init__(*args, **kwargs)
-        datasets = self.request.app['config']['authz_admin']['datasets']
-        if self['dataset'] not in datasets:
-            raise web.HTTPNotFound(text="No such dataset")
-        self._dataset = datasets[self['dataset']]
-        scopes = self._dataset['scopes']
-        if self['scope'] not in scopes:
-            raise web.HTTPNotFound()
-        self._scope = scopes[self['scope']]
+        if dataset is None:
+            datasets = self.request.app['config']['authz_admin']['datasets']
+            if self['dataset'] not in datasets:
+                raise web.HTTPNotFound(text="No such dataset")
+            dataset = datasets[self['dataset']]
+        self._dataset = dataset
+        if scope is None:
+            scopes = self._dataset['scopes']
+            if self['scope'] not in scopes:
+                raise web.HTTPNotFound()
+            scope = scopes[self['scope']]
+        self._scope = scope
 
     @property
     def link_name(self):